@@ -2,47 +2,334 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+import sys
+import threading
+from functools import lru_cache
+from itertools import count
 
-from typing import Dict, List
-from uuid import UUID
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple, Type, get_args
+from uuid import uuid4
 
+import orjson
+from pydantic import BaseModel
 from fastapi import FastAPI, HTTPException
 from fastapi import Query, Path
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional
 
 from models.person import PersonCreate, PersonRead, PersonUpdate
 from models.address import AddressCreate, AddressRead, AddressUpdate
 from models.health import Health
-from models.course import CourseCreate, CourseRead, CourseUpdate
+from models.course import CourseCreate, CourseLevel, CourseRead, CourseTerm, CourseUpdate
+from utils.timestamps import utc_now, utc_timestamp
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+# Resolved once at import: a per-request gethostbyname() can block on DNS/NSS.
+try:
+    _LOCAL_IP = socket.gethostbyname(socket.gethostname())
+except OSError:
+    _LOCAL_IP = "127.0.0.1"
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
-persons: Dict[UUID, PersonRead] = {}
-addresses: Dict[UUID, AddressRead] = {}
-courses: Dict[UUID, CourseRead] = {}
+# Records stay Pydantic *Read models: they are validated once at the request
+# boundary, updates go through model_copy() without re-validation, and the read
+# paths only touch the side tables below (cached JSON, indexes), never the models.
+#
+# Records are keyed by the 16 raw UUID bytes (UUID.bytes), which hash faster
+# than the 36-char string. Path ids are checked against UUID_PATTERN and
+# converted with bytes.fromhex, so lookups never construct a UUID object.
+Key = bytes
+
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+
+def record_key(raw: str) -> Key:
+    return bytes.fromhex(raw.replace("-", ""))
+
+persons: Dict[Key, PersonRead] = {}
+addresses: Dict[Key, AddressRead] = {}
+courses: Dict[Key, CourseRead] = {}
+
+# Pre-serialized JSON body of every stored record, refreshed on each write
+person_blobs: Dict[Key, bytes] = {}
+address_blobs: Dict[Key, bytes] = {}
+course_blobs: Dict[Key, bytes] = {}
+
+# Creation sequence number of every stored record; filtered listings are sorted
+# by it so they come back in the same order as the unfiltered ones.
+person_seq: Dict[Key, int] = {}
+address_seq: Dict[Key, int] = {}
+course_seq: Dict[Key, int] = {}
+_next_seq = count()
+
+# Serializes writers; readers take no lock and instead rely on the write order
+# in save_record/delete_record and tolerate ids removed by a concurrent delete.
+_write_lock = threading.Lock()
+
+# Lower-cased (title, instructor, department) per course for the substring filters
+course_search: Dict[Key, Tuple[str, str, str]] = {}
+
+# -----------------------------------------------------------------------------
+# Secondary indexes (field -> value -> ids), kept in sync on every write.
+# Buckets are dicts used as sets; result order comes from the *_seq tables.
+# -----------------------------------------------------------------------------
+Index = Dict[str, Dict[Any, Dict[Key, None]]]
+
+address_idx: Index = {f: {} for f in ("street", "city", "state", "postal_code", "country")}
+person_idx: Index = {
+    f: {} for f in ("uni", "first_name", "last_name", "email", "phone", "birth_date", "city", "country")
+}
+course_idx: Index = {f: {} for f in ("code", "level", "term", "year")}
+
+
+def address_keys(a: AddressRead) -> Dict[str, Iterable[Any]]:
+    return {
+        "street": (a.street,),
+        "city": (a.city,),
+        "state": (a.state,),
+        "postal_code": (a.postal_code,),
+        "country": (a.country,),
+    }
+
+
+def person_keys(p: PersonRead) -> Dict[str, Iterable[Any]]:
+    return {
+        "uni": (p.uni,),
+        "first_name": (p.first_name,),
+        "last_name": (p.last_name,),
+        "email": (p.email,),
+        "phone": (p.phone,),
+        # the birth_date query param is matched against the string form
+        "birth_date": (str(p.birth_date),),
+        # nested: a person is listed under every city/country of its addresses
+        "city": p._cities,
+        "country": p._countries,
+    }
+
+
+def with_places(p: PersonRead) -> PersonRead:
+    """Recompute the cached address cities/countries; call whenever ``addresses`` changes."""
+    p._cities = frozenset(addr.city for addr in p.addresses)
+    p._countries = frozenset(addr.country for addr in p.addresses)
+    return p
+
+
+# level/term are indexed by enum ordinal; query strings are mapped once per request
+_LEVEL_ORD: Dict[str, int] = {m.value: n for n, m in enumerate(CourseLevel)}
+_TERM_ORD: Dict[str, int] = {m.value: n for n, m in enumerate(CourseTerm)}
+
+
+def ordinal(table: Dict[str, int], value: Optional[str]) -> Optional[int]:
+    """Ordinal for a query value; unknown values map to -1, which no bucket holds."""
+    return None if value is None else table.get(value, -1)
+
+
+def course_keys(c: CourseRead) -> Dict[str, Iterable[Any]]:
+    return {
+        "code": (c.code,),
+        "level": (_LEVEL_ORD[c.level.value],),
+        "term": (_TERM_ORD[c.term.value],),
+        "year": (c.year,),
+    }
+
+
+def index_add(idx: Index, keys: Dict[str, Iterable[Any]], obj_id: Key) -> None:
+    for field, values in keys.items():
+        buckets = idx[field]
+        for value in values:
+            buckets.setdefault(value, {})[obj_id] = None
+
+
+def index_discard(idx: Index, keys: Dict[str, Iterable[Any]], obj_id: Key) -> None:
+    for field, values in keys.items():
+        buckets = idx[field]
+        for value in values:
+            ids = buckets.get(value)
+            if ids is not None:
+                ids.pop(obj_id, None)
+                if not ids:
+                    del buckets[value]
+
+
+def index_update(
+    idx: Index, old_keys: Dict[str, Iterable[Any]], new_keys: Dict[str, Iterable[Any]], obj_id: Key
+) -> None:
+    """Move ``obj_id`` only for values that changed, so untouched buckets keep their order."""
+    for field, values in new_keys.items():
+        old_values, new_values = set(old_keys[field]), set(values)
+        if old_values != new_values:
+            index_discard(idx, {field: old_values - new_values}, obj_id)
+            index_add(idx, {field: new_values - old_values}, obj_id)
+
+
+def index_candidates(idx: Index, seq: Dict[Key, int], **filters: Any) -> Iterable[Key]:
+    """Intersect the index buckets of every non-None filter; all ids if none is set.
+
+    Ids are returned in creation order, like an unfiltered listing of the store.
+    """
+    buckets: List[Dict[Key, None]] = []
+    for field, value in filters.items():
+        if value is None:
+            continue
+        ids = idx[field].get(value)
+        if not ids:
+            return []
+        buckets.append(ids)
+    if not buckets:
+        # snapshot: handlers run in a threadpool, so the dict may grow while
+        # the caller iterates; list() copies it without releasing the GIL
+        return list(seq)
+
+    # The smallest bucket bounds the result, so start there and only probe
+    # the larger ones (e.g. year/level, which hold most of the catalog).
+    buckets.sort(key=len)
+    candidates = list(buckets[0])
+    for ids in buckets[1:]:
+        candidates = [i for i in candidates if i in ids]
+        if not candidates:
+            break
+    # ids deleted meanwhile sort first; json_list_response drops them
+    candidates.sort(key=lambda i: seq.get(i, -1))
+    return candidates
+
 
 app = FastAPI(
     title="Person/Address/Course API",
     description="Demo FastAPI app using Pydantic v2 models for Person, Address, and Course",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
+# -----------------------------------------------------------------------------
+# JSON responses
+# -----------------------------------------------------------------------------
+# Handlers return a ready-made Response so FastAPI skips jsonable_encoder and
+# response_model re-validation; response_model is kept for the OpenAPI docs.
+# Records are encoded once per write (see save_record) and reads only copy the
+# cached bytes.
+
+def encode(record: BaseModel) -> bytes:
+    return record.model_dump_json().encode()
+
+
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def json_list_response(blobs: Dict[Key, bytes], ids: Iterable[Key]) -> Response:
+    # .get: an id may have been deleted after the caller collected it
+    parts = [blob for blob in map(blobs.get, ids) if blob is not None]
+    return json_response(b"[" + b",".join(parts) + b"]")
+
+# -----------------------------------------------------------------------------
+# Record writes: store + indexes + cached JSON always change together
+# -----------------------------------------------------------------------------
+
+def save_record(
+    store: Dict[Key, Any],
+    blobs: Dict[Key, bytes],
+    seq: Dict[Key, int],
+    idx: Index,
+    keys: Callable[[Any], Dict[str, Iterable[Any]]],
+    obj_id: Key,
+    record: BaseModel,
+) -> bytes:
+    """Store ``record`` under ``obj_id`` and refresh its index entries and cached JSON."""
+    blob = encode(record)
+    with _write_lock:
+        old = store.get(obj_id)
+        store[obj_id] = record
+        blobs[obj_id] = blob
+        # sequenced and indexed last, so any id a concurrent reader finds
+        # already has its record and cached JSON in place
+        if old is None:
+            seq[obj_id] = next(_next_seq)
+            index_add(idx, keys(record), obj_id)
+        else:
+            index_update(idx, keys(old), keys(record), obj_id)
+    return blob
+
+
+@lru_cache(maxsize=None)
+def non_nullable_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    return frozenset(
+        name for name, field in model.model_fields.items()
+        if type(None) not in get_args(field.annotation)
+    )
+
+
+def changes(update: BaseModel, read_model: Type[BaseModel]) -> Dict[str, Any]:
+    """Fields explicitly set on an already-validated update payload.
+
+    Read off the attributes rather than via model_dump() so nested models
+    (e.g. a person's addresses) stay model instances for model_copy().
+    model_copy() does not validate, and every *Update field is Optional, so an
+    explicit null for a field the Read model requires is rejected here.
+    """
+    data = {name: getattr(update, name) for name in update.model_fields_set}
+    for name in non_nullable_fields(read_model).intersection(data):
+        if data[name] is None:
+            raise HTTPException(status_code=422, detail=f"Field '{name}' may not be null")
+    return data
+
+
+def delete_record(
+    store: Dict[Key, Any],
+    blobs: Dict[Key, bytes],
+    seq: Dict[Key, int],
+    idx: Index,
+    keys: Callable[[Any], Dict[str, Iterable[Any]]],
+    obj_id: Key,
+) -> None:
+    with _write_lock:
+        # unindexed and unsequenced first, so new lookups stop finding the id
+        # before its record and cached JSON go away
+        index_discard(idx, keys(store[obj_id]), obj_id)
+        del seq[obj_id]
+        del store[obj_id]
+        del blobs[obj_id]
+
+
+def intern_course_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern course strings that recur across the catalog so equal values share one object."""
+    for name in ("code", "instructor", "department"):
+        if data.get(name) is not None:
+            data[name] = sys.intern(data[name])
+    if data.get("prerequisites") is not None:
+        data["prerequisites"] = [sys.intern(p) for p in data["prerequisites"]]
+    return data
+
+
+def save_course_record(course_id: Key, record: CourseRead) -> bytes:
+    course_search[course_id] = (
+        record.title.lower(),
+        sys.intern(record.instructor.lower()),
+        sys.intern(record.department.lower()),
+    )
+    return save_record(courses, course_blobs, course_seq, course_idx, course_keys, course_id, record)
+
+
+def delete_course_record(course_id: Key) -> None:
+    delete_record(courses, course_blobs, course_seq, course_idx, course_keys, course_id)
+    del course_search[course_id]
+
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
-def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
-    return Health(
-        status=200,
-        status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
-        echo=echo,
-        path_echo=path_echo
+# The Health body is spliced from preformatted pieces (same field order as
+# the model); only the timestamp and the echoes change between calls.
+_HEALTH_HEAD = b'{"status":200,"status_message":"OK","timestamp":"'
+_HEALTH_IP = b'","ip_address":' + orjson.dumps(_LOCAL_IP) + b',"echo":'
+
+
+def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Response:
+    return json_response(
+        _HEALTH_HEAD + utc_timestamp().encode() + _HEALTH_IP
+        + orjson.dumps(echo) + b',"path_echo":' + orjson.dumps(path_echo) + b"}"
     )
 
 @app.get("/health", response_model=Health)
@@ -59,10 +346,15 @@ def get_health_with_path(
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
 def create_address(address: AddressCreate):
-    if address.id in addresses:
+    key = address.id.bytes
+    if key in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    now = utc_now()
+    address_read = AddressRead.model_construct(**address.__dict__, created_at=now, updated_at=now)
+    blob = save_record(
+        addresses, address_blobs, address_seq, address_idx, address_keys, key, address_read
+    )
+    return json_response(blob, status_code=201)
 
 @app.get("/addresses", response_model=List[AddressRead])
 def list_addresses(
@@ -72,45 +364,52 @@ def list_addresses(
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+    ids = index_candidates(
+        address_idx, address_seq,
+        street=street, city=city, state=state, postal_code=postal_code, country=country,
+    )
+    return json_list_response(address_blobs, ids)
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
-    if address_id not in addresses:
+def get_address(
+    address_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the address to retrieve")
+):
+    key = record_key(address_id)
+    if key not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return json_response(address_blobs[key])
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
-    if address_id not in addresses:
+def update_address(
+    address_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the address to update"),
+    update: AddressUpdate = ...,
+):
+    key = record_key(address_id)
+    if key not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    update_data = changes(update, AddressRead)
+    if update_data:
+        save_record(
+            addresses, address_blobs, address_seq, address_idx, address_keys,
+            key, addresses[key].model_copy(update=update_data),
+        )
+    return json_response(address_blobs[key])
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 @app.post("/persons", response_model=PersonRead, status_code=201)
 def create_person(person: PersonCreate):
-    # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
-    return person_read
+    # Each person gets its own UUID; stored as PersonRead. The body was already
+    # validated by FastAPI, so model_construct skips a second validation pass.
+    now = utc_now()
+    person_read = with_places(
+        PersonRead.model_construct(**person.__dict__, id=uuid4(), created_at=now, updated_at=now)
+    )
+    blob = save_record(
+        persons, person_blobs, person_seq, person_idx, person_keys, person_read.id.bytes, person_read
+    )
+    return json_response(blob, status_code=201)
 
 @app.get("/persons", response_model=List[PersonRead])
 def list_persons(
@@ -123,43 +422,37 @@ def list_persons(
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+    ids = index_candidates(
+        person_idx, person_seq,
+        uni=uni, first_name=first_name, last_name=last_name, email=email,
+        phone=phone, birth_date=birth_date, city=city, country=country,
+    )
+    return json_list_response(person_blobs, ids)
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
-    if person_id not in persons:
+def get_person(
+    person_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the person to retrieve")
+):
+    key = record_key(person_id)
+    if key not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return json_response(person_blobs[key])
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
-    if person_id not in persons:
+def update_person(
+    person_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the person to update"),
+    update: PersonUpdate = ...,
+):
+    key = record_key(person_id)
+    if key not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    update_data = changes(update, PersonRead)
+    if update_data:
+        person_read = persons[key].model_copy(update=update_data)
+        if "addresses" in update_data:
+            with_places(person_read)
+        save_record(persons, person_blobs, person_seq, person_idx, person_keys, key, person_read)
+    return json_response(person_blobs[key])
 
 # -----------------------------------------------------------------------------
 # Course endpoints
@@ -177,73 +470,101 @@ def list_courses(
     """
     Retrieve a list of all courses with optional filtering parameters.
     """
-    results = list(courses.values())
-    
-    if code is not None:
-        results = [c for c in results if c.code == code]
-    if title is not None:
-        results = [c for c in results if title.lower() in c.title.lower()]
-    if instructor is not None:
-        results = [c for c in results if instructor.lower() in c.instructor.lower()]
-    if department is not None:
-        results = [c for c in results if department.lower() in c.department.lower()]
-    if level is not None:
-        results = [c for c in results if c.level == level]
-    if term is not None:
-        results = [c for c in results if c.term == term]
-    if year is not None:
-        results = [c for c in results if c.year == year]
-    
-    return results
+    ids = index_candidates(
+        course_idx, course_seq,
+        code=code, level=ordinal(_LEVEL_ORD, level), term=ordinal(_TERM_ORD, term), year=year,
+    )
+
+    # substring filters have no index; scan only the surviving candidates once,
+    # matching against the lower-cased copies kept in course_search. An unset
+    # filter becomes "", which every string contains.
+    if title is not None or instructor is not None or department is not None:
+        title_lc = (title or "").lower()
+        instructor_lc = (instructor or "").lower()
+        department_lc = (department or "").lower()
+        search = course_search
+        ids = [
+            i for i in ids
+            # a course deleted meanwhile has no search entry and is skipped
+            if (s := search.get(i)) is not None
+            and title_lc in s[0] and instructor_lc in s[1] and department_lc in s[2]
+        ]
+
+    return json_list_response(course_blobs, ids)
 
 @app.post("/courses", response_model=CourseRead, status_code=201, summary="Create a new course", tags=["courses"])
 def create_course(course: CourseCreate):
     """
     Create a new course with the provided information.
     """
-    course_read = CourseRead(**course.model_dump())
-    courses[course_read.id] = course_read
-    return course_read
+    now = utc_now()
+    course_read = CourseRead.model_construct(
+        **intern_course_fields(dict(course.__dict__)), id=uuid4(), created_at=now, updated_at=now
+    )
+    blob = save_course_record(course_read.id.bytes, course_read)
+    return json_response(blob, status_code=201)
+
+@app.post(
+    "/courses:batch",
+    response_model=List[CourseRead],
+    status_code=201,
+    summary="Create several courses at once",
+    tags=["courses"],
+)
+def create_courses_batch(new_courses: List[CourseCreate]):
+    """
+    Create every course in the payload in one request; the response lists them in the same order.
+    """
+    now = utc_now()
+    blobs = []
+    for course in new_courses:
+        course_read = CourseRead.model_construct(
+            **intern_course_fields(dict(course.__dict__)), id=uuid4(), created_at=now, updated_at=now
+        )
+        blobs.append(save_course_record(course_read.id.bytes, course_read))
+    return json_response(b"[" + b",".join(blobs) + b"]", status_code=201)
 
 @app.get("/courses/{course_id}", response_model=CourseRead, summary="Get a specific course", tags=["courses"])
 def get_course(
-    course_id: UUID = Path(..., description="The UUID of the course to retrieve")
+    course_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the course to retrieve")
 ):
     """
     Retrieve details of a specific course by its ID.
     """
-    if course_id not in courses:
+    key = record_key(course_id)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_id]
+    return json_response(course_blobs[key])
 
 @app.put("/courses/{course_id}", response_model=CourseRead, summary="Update a course", tags=["courses"])
 def update_course(
-    course_id: UUID = Path(..., description="The UUID of the course to update"),
+    course_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the course to update"),
     update: CourseUpdate = ...,
 ):
     """
     Update a course's information. Only provided fields will be updated.
     """
-    if course_id not in courses:
+    key = record_key(course_id)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    stored = courses[course_id].model_dump()
-    update_data = update.model_dump(exclude_unset=True)
+    update_data = changes(update, CourseRead)
     if update_data:
-        stored.update(update_data)
-        stored["updated_at"] = datetime.utcnow()
-        courses[course_id] = CourseRead(**stored)
-    return courses[course_id]
+        intern_course_fields(update_data)
+        update_data["updated_at"] = utc_now()
+        save_course_record(key, courses[key].model_copy(update=update_data))
+    return json_response(course_blobs[key])
 
 @app.delete("/courses/{course_id}", status_code=204, summary="Delete a course", tags=["courses"])
 def delete_course(
-    course_id: UUID = Path(..., description="The UUID of the course to delete")
+    course_id: str = Path(..., pattern=UUID_PATTERN, description="The UUID of the course to delete")
 ):
     """
     Delete a course from the system.
     """
-    if course_id not in courses:
+    key = record_key(course_id)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    del courses[course_id]
+    delete_course_record(key)
     return None
 
 # -----------------------------------------------------------------------------
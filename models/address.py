@@ -5,6 +5,8 @@ from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from utils.timestamps import utc_now
+
 
 class AddressBase(BaseModel):
     id: UUID = Field(
@@ -39,6 +41,9 @@ class AddressBase(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
+        # stored records are replaced via model_copy(), never mutated in place
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -91,6 +96,7 @@ class AddressUpdate(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -108,12 +114,12 @@ class AddressUpdate(BaseModel):
 
 class AddressRead(AddressBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
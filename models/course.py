@@ -6,6 +6,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field, StringConstraints
 from enum import Enum
 
+from utils.timestamps import utc_now
+
 # Course code pattern: DEPT + 4 digits (e.g., COMS4153)
 CourseCodeType = Annotated[str, StringConstraints(pattern=r"^[A-Z]{2,4}\d{4}$")]
 
@@ -95,6 +97,10 @@ class CourseBase(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
+        # stored records are replaced via model_copy(), never mutated in place
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -187,6 +193,7 @@ class CourseUpdate(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {"instructor": "Dr. New Instructor", "max_enrollment": 60},
@@ -205,12 +212,12 @@ class CourseRead(CourseBase):
         json_schema_extra={"example": "88888888-8888-4888-8888-888888888888"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
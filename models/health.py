@@ -11,6 +11,7 @@ class Health(BaseModel):
 
     # Pydantic v2 style
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "example": {
                 "status": 200,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Optional, List, Annotated
+from typing import FrozenSet, Optional, List, Annotated
 from uuid import UUID, uuid4
 from datetime import date, datetime
-from pydantic import BaseModel, Field, EmailStr, StringConstraints
+from pydantic import BaseModel, Field, EmailStr, PrivateAttr, StringConstraints
+
+from utils.timestamps import utc_now
 
 from .address import AddressBase
 
@@ -62,6 +64,9 @@ class PersonBase(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
+        # stored records are replaced via model_copy(), never mutated in place
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -143,6 +148,7 @@ class PersonUpdate(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {"first_name": "Ada", "last_name": "Byron"},
@@ -172,16 +178,21 @@ class PersonRead(PersonBase):
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Cities/countries of `addresses`, not serialized; refreshed by the API
+    # whenever the addresses change and carried over by model_copy() otherwise.
+    _cities: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+    _countries: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
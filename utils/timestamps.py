@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time (``datetime.utcnow`` is deprecated)."""
+    return datetime.now(timezone.utc)
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with millisecond precision, e.g. ``2025-09-02T12:34:56.789Z``.
+
+    Formatted straight from ``time.time()`` so no ``datetime`` object is built per call.
+    """
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + ".%03dZ" % (now % 1 * 1000)